@@ -7,6 +7,8 @@ from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from googleapiclient.http import MediaIoBaseDownload
 
+DOWNLOAD_RETRIES = 5
+
 
 def get_drive_service():
     """Authenticate with Google Drive using service account credentials."""
@@ -50,6 +52,15 @@ def download_latest_csv(folder_id, output_path):
         return None
 
     latest = files[0]
+
+    # Skip the download if the local copy matches the Drive file's modifiedTime
+    mtime_path = f"{output_path}.mtime"
+    if os.path.exists(output_path) and os.path.exists(mtime_path):
+        with open(mtime_path) as f:
+            if f.read().strip() == latest["modifiedTime"]:
+                print(f"Unchanged, skipping: {latest['name']} (modified: {latest['modifiedTime']})")
+                return output_path
+
     print(f"Downloading: {latest['name']} (modified: {latest['modifiedTime']})")
 
     request = service.files().get_media(fileId=latest["id"])
@@ -57,7 +68,13 @@ def download_latest_csv(folder_id, output_path):
         downloader = MediaIoBaseDownload(f, request)
         done = False
         while not done:
-            _, done = downloader.next_chunk()
+            # Retries 5xx/429 responses with exponential backoff, resuming from the last chunk
+            _, done = downloader.next_chunk(num_retries=DOWNLOAD_RETRIES)
+
+    tmp_path = f"{mtime_path}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(latest["modifiedTime"])
+    os.replace(tmp_path, mtime_path)
 
     print(f"Saved to: {output_path}")
     return output_path
@@ -1,84 +1,195 @@
 import argparse
 import csv
+import hashlib
+import json
 import os
-from collections import OrderedDict
+import sqlite3
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from datetime import datetime, timedelta
 
-import pytz
-from dotenv import load_dotenv
-from notion_client import Client
-
-local_tz = pytz.timezone("Europe/Zurich")
+# Third-party and zoneinfo imports are deferred to first use so --help and
+# no-op runs start quickly
+local_tz = None
 
 STRENGTH_ICON = "https://img.icons8.com/?size=100&id=107640&format=png&color=000000"
 
-
-def parse_csv(csv_path):
-    """Parse Strong CSV and group rows into workouts keyed by date timestamp."""
-    workouts = OrderedDict()
+# Notion allows an average of 3 requests/s per integration; stay just below it
+NOTION_REQUESTS_PER_SEC = 2.7
+NOTION_WORKERS = 5
+# Workouts queued or running at once; bounds memory while streaming the CSV
+MAX_PENDING_WORKOUTS = NOTION_WORKERS * 2
+BLOCK_DELETE_WORKERS = 3
+# Maximum number of blocks Notion accepts in a single children array
+NOTION_BLOCK_LIMIT = 100
+
+# Local SQLite record of synced workouts, used to skip Notion entirely when nothing changed
+STATE_DB_PATH = ".strong_sync.db"
+
+
+class RateLimiter:
+    """Token bucket shared by all threads issuing Notion requests."""
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def wait(self, request=None):
+        """Block until a request may be sent (usable as an httpx request hook)."""
+        with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                time.sleep((1 - self.tokens) / self.rate)
+
+
+def iter_workouts(csv_path):
+    """Yield workouts from a Strong CSV one at a time.
+
+    Strong exports rows grouped by workout, so a workout is complete as soon as
+    the Date column changes.
+    """
+    workout = None
 
     with open(csv_path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f, delimiter=";", quotechar='"')
+        reader = csv.reader(f, delimiter=";", quotechar='"')
+        header = next(reader, None)
+        if header is None:
+            return
+
+        # Bind column positions to locals so the row loop only does list indexing.
+        # Required columns fail here; optional ones are None when absent.
+        i_date = header.index("Date")
+        i_workout = header.index("Workout Name")
+        i_duration = header.index("Duration (sec)")
+        i_exercise = header.index("Exercise Name")
+        i_set_order = header.index("Set Order")
+        i_weight, i_reps, i_distance, i_seconds, i_notes = (
+            header.index(c) if c in header else None
+            for c in ("Weight (kg)", "Reps", "Distance (meters)", "Seconds", "Notes")
+        )
+
         for row in reader:
-            if row["Set Order"] == "Rest Timer":
+            if not row:
+                continue
+
+            set_order = row[i_set_order]
+            if set_order == "Rest Timer":
                 continue
 
-            date = row["Date"]
-            if date not in workouts:
-                workouts[date] = {
+            date = row[i_date]
+            if workout is None or workout["date"] != date:
+                if workout is not None:
+                    yield workout
+                workout = {
                     "date": date,
-                    "name": row["Workout Name"],
-                    "duration_sec": int(row["Duration (sec)"]),
+                    "name": row[i_workout],
+                    "duration_sec": int(row[i_duration]),
                     "exercises": [],
+                    "groups": {},
                 }
 
-            workouts[date]["exercises"].append(
-                {
-                    "exercise": row["Exercise Name"],
-                    "set_order": row["Set Order"],
-                    "weight_kg": row.get("Weight (kg)", ""),
-                    "reps": row.get("Reps", ""),
-                    "distance_m": row.get("Distance (meters)", ""),
-                    "seconds": row.get("Seconds", ""),
-                    "notes": row.get("Notes", ""),
-                }
-            )
+            weight_kg = row[i_weight] if i_weight is not None else ""
+            reps = row[i_reps] if i_reps is not None else ""
+            distance_m = row[i_distance] if i_distance is not None else ""
+            seconds = row[i_seconds] if i_seconds is not None else ""
+            # Keep the raw strings for display checks and convert numbers once here
+            ex = {
+                "exercise": row[i_exercise],
+                "set_order": set_order,
+                "weight_kg": weight_kg,
+                "reps": reps,
+                "distance_m": distance_m,
+                "seconds": seconds,
+                "notes": row[i_notes] if i_notes is not None else "",
+                "weight_kg_f": float(weight_kg) if weight_kg else 0.0,
+                "reps_i": int(reps) if reps else 0,
+                "distance_m_f": float(distance_m) if distance_m else 0.0,
+                "seconds_f": float(seconds) if seconds else 0.0,
+            }
+            workout["exercises"].append(ex)
+            add_to_group(workout["groups"], ex)
+
+    if workout is not None:
+        yield workout
+
+
+def add_to_group(groups, ex):
+    """Add an exercise row to its group, updating the set totals in the same pass."""
+    name = ex["exercise"]
+    if name not in groups:
+        groups[name] = {
+            "sets": [],
+            "notes": [],
+            "max_weight": 0,
+            "total_volume": 0,
+            "total_reps": 0,
+        }
+    group = groups[name]
 
-    return workouts
+    if ex["set_order"] == "Note":
+        group["notes"].append(ex["notes"])
+        return
 
+    group["sets"].append(ex)
+    weight = ex["weight_kg_f"]
+    reps = ex["reps_i"]
+    group["max_weight"] = max(group["max_weight"], weight)
+    group["total_volume"] += weight * reps
+    group["total_reps"] += reps
 
-def group_exercises(exercises):
-    """Group exercise rows by name, maintaining order."""
-    groups = OrderedDict()
-    for ex in exercises:
-        name = ex["exercise"]
-        if name not in groups:
-            groups[name] = {"sets": [], "notes": []}
-        if ex["set_order"] == "Note":
-            groups[name]["notes"].append(ex["notes"])
-        else:
-            groups[name]["sets"].append(ex)
-    return groups
 
+def query_all(client, database_id, query_filter):
+    """Return every page in a database matching a filter, following pagination."""
+    pages = []
+    has_more = True
+    start_cursor = None
 
-def workout_exists(client, database_id, workout_date):
-    """Check if a workout already exists by its strong-{timestamp} ID."""
-    strong_id = f"strong-{workout_date}"
-    try:
-        query = client.databases.query(
-            database_id=database_id,
-            filter={"property": "Garmin ID", "multi_select": {"contains": strong_id}},
-        )
-        if query["results"]:
-            return query["results"][0]
-    except Exception as e:
-        print(f"Error checking for existing workout: {e}")
-    return None
+    while has_more:
+        query_params = {"database_id": database_id, "filter": query_filter, "page_size": 100}
+        if start_cursor:
+            query_params["start_cursor"] = start_cursor
+
+        response = client.databases.query(**query_params)
+        pages.extend(response["results"])
+
+        has_more = response.get("has_more", False)
+        start_cursor = response.get("next_cursor")
+
+    return pages
+
+
+def load_existing_workouts(client, database_id, since=None):
+    """Index existing Strong workout pages by workout date as (strong ID, page) pairs."""
+    conditions = [
+        {"property": "Garmin ID", "multi_select": {"is_not_empty": True}},
+        {"property": "Activity Type", "select": {"equals": "Strength"}},
+    ]
+    if since:
+        conditions.append({"property": "Date", "date": {"on_or_after": since}})
+
+    existing = {}
+    for page in query_all(client, database_id, {"and": conditions}):
+        for option in page["properties"]["Garmin ID"]["multi_select"]:
+            name = option["name"]
+            if name.startswith("strong-"):
+                # strong-{YYYY-MM-DD HH:MM:SS}[-{hash}]
+                date = name[len("strong-") :][:19]
+                existing.setdefault(date, (name, page))
+    return existing
 
 
 def format_time(total_seconds):
     """Format seconds into mm:ss or h:mm:ss."""
-    total_seconds = int(float(total_seconds))
+    total_seconds = int(total_seconds)
     hours = total_seconds // 3600
     minutes = (total_seconds % 3600) // 60
     seconds = total_seconds % 60
@@ -90,30 +201,41 @@ def format_time(total_seconds):
 def format_set(ex):
     """Format a single set's weight/reps display values."""
     if ex["distance_m"]:
-        distance_km = float(ex["distance_m"]) / 1000
+        distance_km = ex["distance_m_f"] / 1000
         weight_display = f"{distance_km:.2f} km"
-        reps_display = format_time(ex["seconds"]) if ex["seconds"] else ""
+        reps_display = format_time(ex["seconds_f"]) if ex["seconds"] else ""
     elif ex["seconds"] and not ex["weight_kg"]:
         weight_display = ""
-        reps_display = format_time(ex["seconds"])
+        reps_display = format_time(ex["seconds_f"])
     else:
-        weight = float(ex["weight_kg"]) if ex["weight_kg"] else 0
+        weight = ex["weight_kg_f"]
         weight_display = "BW" if weight == 0 else f"{weight:g}"
         reps_display = ex["reps"] if ex["reps"] else ""
     return weight_display, reps_display
 
 
-def build_page_content(exercises):
+def _txt(content):
+    """Wrap a string as Notion rich text."""
+    return [{"type": "text", "text": {"content": content}}]
+
+
+# Header row shared by every set table; it never changes
+SET_TABLE_HEADER = {
+    "type": "table_row",
+    "table_row": {"cells": [_txt("Set"), _txt("Weight (kg)"), _txt("Reps")]},
+}
+
+
+def build_page_content(exercise_groups):
     """Build Notion blocks with a heading and table per exercise."""
     blocks = []
-    exercise_groups = group_exercises(exercises)
 
     for i, (exercise_name, data) in enumerate(exercise_groups.items()):
         # Heading per exercise
         blocks.append(
             {
                 "type": "heading_3",
-                "heading_3": {"rich_text": [{"type": "text", "text": {"content": exercise_name}}]},
+                "heading_3": {"rich_text": _txt(exercise_name)},
             }
         )
 
@@ -136,16 +258,11 @@ def build_page_content(exercises):
 
         # Table for sets
         if data["sets"]:
-            headers = ["Set", "Weight (kg)", "Reps"]
-            header_cells = [[{"type": "text", "text": {"content": h}}] for h in headers]
-            table_rows = [{"type": "table_row", "table_row": {"cells": header_cells}}]
+            table_rows = [SET_TABLE_HEADER]
 
             for s in data["sets"]:
                 weight_display, reps_display = format_set(s)
-                cells = [
-                    [{"type": "text", "text": {"content": c}}]
-                    for c in [s["set_order"], weight_display, reps_display]
-                ]
+                cells = [_txt(s["set_order"]), _txt(weight_display), _txt(reps_display)]
                 table_rows.append({"type": "table_row", "table_row": {"cells": cells}})
 
             blocks.append(
@@ -167,32 +284,80 @@ def build_page_content(exercises):
     return blocks
 
 
+def append_blocks_chunked(client, page_id, blocks, chunk=NOTION_BLOCK_LIMIT):
+    """Append blocks in as few requests as Notion's per-request block limit allows."""
+    for i in range(0, len(blocks), chunk):
+        client.blocks.children.append(block_id=page_id, children=blocks[i : i + chunk])
+
+
+def append_workout_section(client, page_id, blocks):
+    """Append page content under one toggle heading so a rebuild replaces a single block.
+
+    The heading is created empty and filled in a second request, since Notion only
+    accepts two levels of nesting per request and tables already use both.
+    """
+    section = {
+        "type": "heading_2",
+        "heading_2": {"rich_text": _txt("Workout"), "is_toggleable": True},
+    }
+    result = client.blocks.children.append(block_id=page_id, children=[section])
+    append_blocks_chunked(client, result["results"][0]["id"], blocks)
+
+
 def replace_page_content(client, page_id, blocks):
-    """Delete existing page content blocks and append new ones."""
-    existing = client.blocks.children.list(block_id=page_id)
-    for block in existing["results"]:
-        client.blocks.delete(block_id=block["id"])
-    while existing.get("has_more"):
-        existing = client.blocks.children.list(
-            block_id=page_id, start_cursor=existing["next_cursor"]
-        )
-        for block in existing["results"]:
-            client.blocks.delete(block_id=block["id"])
+    """Replace existing page content blocks with a new workout section."""
+    block_ids = []
+    start_cursor = None
+    while True:
+        kwargs = {"block_id": page_id}
+        if start_cursor:
+            kwargs["start_cursor"] = start_cursor
+        existing = client.blocks.children.list(**kwargs)
+        block_ids.extend(block["id"] for block in existing["results"])
+        if not existing.get("has_more"):
+            break
+        start_cursor = existing["next_cursor"]
 
-    client.blocks.children.append(block_id=page_id, children=blocks)
+    # Add the new content first so a failed append never leaves the page empty
+    append_workout_section(client, page_id, blocks)
+
+    # Pages created with a workout section only have one top-level block to delete
+    with ThreadPoolExecutor(max_workers=BLOCK_DELETE_WORKERS) as executor:
+        list(executor.map(lambda block_id: client.blocks.delete(block_id=block_id), block_ids))
+
+
+def get_local_tz():
+    """Return the Europe/Zurich timezone, loading it on first use."""
+    global local_tz
+    if local_tz is None:
+        from zoneinfo import ZoneInfo
+
+        local_tz = ZoneInfo("Europe/Zurich")
+    return local_tz
 
 
 def make_workout_dates(workout):
     """Compute localized start/end datetimes for a workout."""
-    start_dt = local_tz.localize(datetime.strptime(workout["date"], "%Y-%m-%d %H:%M:%S"))
+    start_dt = datetime.strptime(workout["date"], "%Y-%m-%d %H:%M:%S")
+    start_dt = start_dt.replace(tzinfo=get_local_tz())
     end_dt = start_dt + timedelta(seconds=workout["duration_sec"])
     return start_dt, end_dt
 
 
+def make_content_hash(workout):
+    """Hash a workout's exercise rows so content changes can be detected."""
+    payload = json.dumps(workout["exercises"], sort_keys=True).encode()
+    return hashlib.blake2b(payload, digest_size=4).hexdigest()
+
+
+def make_strong_id(workout):
+    """Build the strong-{timestamp}-{hash} ID, where the hash changes with the workout content."""
+    return f"strong-{workout['date']}-{workout['content_hash']}"
+
+
 def create_workout_page(client, database_id, workout):
     """Create a Notion page for a workout with per-exercise content."""
     start_dt, end_dt = make_workout_dates(workout)
-    strong_id = f"strong-{workout['date']}"
 
     properties = {
         "Activity Name": {"title": [{"text": {"content": workout["name"]}}]},
@@ -200,44 +365,39 @@ def create_workout_page(client, database_id, workout):
         "Activity Type": {"select": {"name": "Strength"}},
         "Subactivity Type": {"select": {"name": "Strength Training"}},
         "Duration (min)": {"number": round(workout["duration_sec"] / 60, 2)},
-        "Distance (km)": {"number": 0},
-        "Calories": {"number": 0},
+        # Zero-valued numbers and unchecked checkboxes are left unset. Avg Pace is
+        # still sent because garmin-activities.py reads its first rich_text item.
         "Avg Pace": {"rich_text": [{"text": {"content": ""}}]},
-        "Avg Power": {"number": 0},
-        "Max Power": {"number": 0},
         "Training Effect": {"select": {"name": "Unknown"}},
-        "Aerobic": {"number": 0},
         "Aerobic Effect": {"select": {"name": "Unknown"}},
-        "Anaerobic": {"number": 0},
         "Anaerobic Effect": {"select": {"name": "Unknown"}},
-        "PR": {"checkbox": False},
-        "Fav": {"checkbox": False},
-        "Garmin ID": {"multi_select": [{"name": strong_id}]},
+        "Garmin ID": {"multi_select": [{"name": workout["strong_id"]}]},
     }
 
+    blocks = build_page_content(workout["groups"])
     page = client.pages.create(
         parent={"database_id": database_id},
         properties=properties,
         icon={"type": "external", "external": {"url": STRENGTH_ICON}},
     )
 
-    blocks = build_page_content(workout["exercises"])
-    client.blocks.children.append(block_id=page["id"], children=blocks)
+    append_workout_section(client, page["id"], blocks)
     return page["id"]
 
 
 def update_workout(client, existing_page, workout):
-    """Update date and rebuild page content for an existing workout."""
+    """Update date, strong ID and page content for an existing workout."""
     start_dt, end_dt = make_workout_dates(workout)
 
     client.pages.update(
         page_id=existing_page["id"],
         properties={
             "Date": {"date": {"start": start_dt.isoformat(), "end": end_dt.isoformat()}},
+            "Garmin ID": {"multi_select": [{"name": workout["strong_id"]}]},
         },
     )
 
-    blocks = build_page_content(workout["exercises"])
+    blocks = build_page_content(workout["groups"])
     replace_page_content(client, existing_page["id"], blocks)
 
 
@@ -280,56 +440,58 @@ def get_or_create_exercise_db(client, activities_db_id):
     return db_id
 
 
-def exercise_entry_exists(client, db_id, date_str, exercise_name):
-    """Check if an exercise entry exists for this date and exercise name."""
-    query = client.databases.query(
-        database_id=db_id,
-        filter={
-            "and": [
-                {"property": "Exercise", "title": {"equals": exercise_name}},
-                {"property": "Date", "date": {"on_or_after": date_str}},
-                {"property": "Date", "date": {"on_or_before": date_str}},
-            ]
-        },
+def load_exercise_entries(client, db_id, since=None):
+    """Index exercise entries by (date, exercise name)."""
+    if since:
+        query_filter = {"property": "Date", "date": {"on_or_after": since}}
+    else:
+        query_filter = {"property": "Date", "date": {"is_not_empty": True}}
+
+    entries = {}
+    for page in query_all(client, db_id, query_filter):
+        props = page["properties"]
+        date_only = props["Date"]["date"]["start"][:10]
+        exercise_name = "".join(t["plain_text"] for t in props["Exercise"]["title"])
+        entries.setdefault((date_only, exercise_name), page)
+    return entries
+
+
+def has_exercise_entries(workout, entries):
+    """Check whether every exercise with sets already has a progress entry."""
+    date_only = make_workout_dates(workout)[0].strftime("%Y-%m-%d")
+    return all(
+        (date_only, exercise_name) in entries
+        for exercise_name, data in workout["groups"].items()
+        if data["sets"]
     )
-    return query["results"][0] if query["results"] else None
 
 
-def sync_exercise_entries(client, db_id, workout):
+def sync_exercise_entries(client, db_id, workout, entries):
     """Create or update exercise summary rows for progress tracking."""
     start_dt, _ = make_workout_dates(workout)
     date_only = start_dt.strftime("%Y-%m-%d")
     date_iso = start_dt.isoformat()
 
-    exercise_groups = group_exercises(workout["exercises"])
+    writes = []
 
-    for exercise_name, data in exercise_groups.items():
-        sets = data["sets"]
-        if not sets:
+    for exercise_name, data in workout["groups"].items():
+        if not data["sets"]:
             continue
 
-        max_weight = 0
-        total_volume = 0
-        total_reps = 0
-
-        for s in sets:
-            weight = float(s["weight_kg"]) if s["weight_kg"] else 0
-            reps = int(s["reps"]) if s["reps"] else 0
-            max_weight = max(max_weight, weight)
-            total_volume += weight * reps
-            total_reps += reps
-
         properties = {
             "Exercise": {"title": [{"text": {"content": exercise_name}}]},
             "Date": {"date": {"start": date_iso}},
-            "Max Weight": {"number": max_weight},
-            "Total Volumn": {"number": round(total_volume, 1)},
-            "Sets": {"number": len(sets)},
-            "Total Reps": {"number": total_reps},
+            "Max Weight": {"number": data["max_weight"]},
+            "Total Volumn": {"number": round(data["total_volume"], 1)},
+            "Sets": {"number": len(data["sets"])},
+            "Total Reps": {"number": data["total_reps"]},
             "Workouts": {"rich_text": [{"text": {"content": workout["name"]}}]},
         }
 
-        existing = exercise_entry_exists(client, db_id, date_only, exercise_name)
+        writes.append((entries.get((date_only, exercise_name)), properties))
+
+    def write_entry(write):
+        existing, properties = write
         if existing:
             client.pages.update(page_id=existing["id"], properties=properties)
         else:
@@ -339,14 +501,100 @@ def sync_exercise_entries(client, db_id, workout):
                 icon={"type": "external", "external": {"url": STRENGTH_ICON}},
             )
 
+    with ThreadPoolExecutor(max_workers=NOTION_WORKERS) as executor:
+        list(executor.map(write_entry, writes))
 
-def main():
-    load_dotenv()
 
+# --- Local Sync State ---
+
+
+def open_state_db(path):
+    """Open the local record of synced workouts, creating it if needed."""
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS synced "
+        "(strong_id TEXT PRIMARY KEY, content_hash TEXT, synced_at TEXT)"
+    )
+    return conn
+
+
+def mark_synced(conn, workout):
+    """Record that a workout's current content is in Notion."""
+    with conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO synced VALUES (?, ?, ?)",
+            (f"strong-{workout['date']}", workout["state_hash"], datetime.now().isoformat()),
+        )
+
+
+def make_notion_client(notion_token):
+    """Create a Notion client sharing one keep-alive HTTP/2 connection pool and rate limit."""
+    import httpx
+    from notion_client import Client
+
+    limiter = RateLimiter(NOTION_REQUESTS_PER_SEC)
+    http_client = httpx.Client(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=20, keepalive_expiry=60),
+        event_hooks={"request": [limiter.wait]},
+    )
+    return Client(auth=notion_token, client=http_client)
+
+
+def sync_workout(client, database_id, exercise_db_id, workout, existing, exercise_entries, rebuild):
+    """Create or rebuild a single workout and its exercise entries, returning the outcome."""
+    date = workout["date"]
+    if existing:
+        existing_id, existing_page = existing
+        if existing_id == workout["strong_id"]:
+            # Content hash matches, so only exercise entries may be missing (e.g. the
+            # exercise DB was configured after the page was created)
+            if exercise_db_id and not has_exercise_entries(workout, exercise_entries):
+                sync_exercise_entries(client, exercise_db_id, workout, exercise_entries)
+                print(f"  Added exercise entries: {workout['name']} - {date}")
+            print(f"  Unchanged: {workout['name']} - {date}")
+            return "unchanged"
+        if rebuild:
+            update_workout(client, existing_page, workout)
+            print(f"  Rebuilt: {workout['name']} - {date}")
+            status = "rebuilt"
+        else:
+            print(f"  Skipped: {workout['name']} - {date}")
+            status = "skipped"
+    else:
+        create_workout_page(client, database_id, workout)
+        print(f"  Created: {workout['name']} - {date}")
+        status = "created"
+
+    # Sync exercise entries for every written or skipped page if DB available
+    if exercise_db_id:
+        sync_exercise_entries(client, exercise_db_id, workout, exercise_entries)
+
+    return status
+
+
+def record_result(state, counts, future, workout):
+    """Tally a finished workout sync, recording it in the local state on success."""
+    try:
+        status = future.result()
+    except Exception as e:
+        print(f"  Failed: {workout['name']} - {workout['date']}: {e}")
+        counts["failed"] += 1
+        return
+
+    counts[status] += 1
+    # Workouts skipped without --rebuild are still stale in Notion
+    if status != "skipped":
+        mark_synced(state, workout)
+
+
+def main():
     parser = argparse.ArgumentParser(description="Sync Strong app CSV to Notion")
     parser.add_argument("--csv", help="Path to Strong CSV export file")
     parser.add_argument(
-        "--rebuild", action="store_true", help="Rebuild page content for existing workouts"
+        "--rebuild",
+        action="store_true",
+        help="Rebuild page content for existing workouts whose data changed",
     )
     parser.add_argument(
         "--days",
@@ -356,6 +604,10 @@ def main():
     )
     args = parser.parse_args()
 
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
     csv_path = args.csv or os.getenv("STRONG_CSV_PATH")
     if not csv_path:
         print("Error: Provide CSV path via --csv argument or STRONG_CSV_PATH env var")
@@ -368,52 +620,92 @@ def main():
         print("Error: NOTION_TOKEN and NOTION_DB_ID environment variables required")
         return
 
-    client = Client(auth=notion_token)
-
-    # Get or create exercise progress database
-    exercise_db_id = get_or_create_exercise_db(client, database_id)
-
-    # Parse CSV
-    all_workouts = parse_csv(csv_path)
-    print(f"Found {len(all_workouts)} workouts in CSV")
-
     # Filter to recent workouts only
+    cutoff = None
+    since = None
     if args.days > 0:
         cutoff = datetime.now() - timedelta(days=args.days)
-        workouts = {
-            date: w
-            for date, w in all_workouts.items()
-            if datetime.strptime(date, "%Y-%m-%d %H:%M:%S") >= cutoff
-        }
-        print(f"Processing {len(workouts)} workouts from the last {args.days} days")
-    else:
-        workouts = all_workouts
-
-    created = 0
-    updated = 0
-    skipped = 0
-
-    for date, workout in workouts.items():
-        existing = workout_exists(client, database_id, date)
-        if existing:
-            if args.rebuild:
-                update_workout(client, existing, workout)
-                print(f"  Rebuilt: {workout['name']} - {date}")
-                updated += 1
-            else:
-                print(f"  Skipped: {workout['name']} - {date}")
-                skipped += 1
-        else:
-            create_workout_page(client, database_id, workout)
-            print(f"  Created: {workout['name']} - {date}")
-            created += 1
-
-        # Always sync exercise entries if DB available
-        if exercise_db_id:
-            sync_exercise_entries(client, exercise_db_id, workout)
-
-    print(f"\nDone: {created} created, {updated} rebuilt, {skipped} skipped")
+        # Pad the Notion lookup window by a day: the date-only filter may be evaluated in
+        # UTC, and extra pages in the index are harmless since lookups use exact keys
+        since = (cutoff - timedelta(days=1)).strftime("%Y-%m-%d")
+
+    state = open_state_db(os.getenv("STRONG_SYNC_STATE_PATH", STATE_DB_PATH))
+    synced_hashes = dict(state.execute("SELECT strong_id, content_hash FROM synced"))
+    # Part of the stored hash, so configuring the exercise DB later re-checks synced workouts
+    state_suffix = "+exercises" if os.getenv("NOTION_EXERCISE_DB_ID") else ""
+
+    # Notion is only contacted once a workout is missing from or changed since the local state
+    client = None
+    exercise_db_id = None
+    existing_workouts = {}
+    exercise_entries = {}
+
+    counts = {"created": 0, "rebuilt": 0, "skipped": 0, "unchanged": 0, "failed": 0}
+    total = 0
+    processed = 0
+    futures = {}
 
+    try:
+        with ThreadPoolExecutor(max_workers=NOTION_WORKERS) as executor:
+            # Stream the CSV so Notion writes start while parsing continues
+            for workout in iter_workouts(csv_path):
+                total += 1
+                date = workout["date"]
+                if cutoff and datetime.strptime(date, "%Y-%m-%d %H:%M:%S") < cutoff:
+                    continue
+                processed += 1
+
+                workout["content_hash"] = make_content_hash(workout)
+                workout["state_hash"] = workout["content_hash"] + state_suffix
+                if synced_hashes.get(f"strong-{date}") == workout["state_hash"]:
+                    print(f"  Unchanged: {workout['name']} - {date}")
+                    counts["unchanged"] += 1
+                    continue
+                workout["strong_id"] = make_strong_id(workout)
+
+                if client is None:
+                    client = make_notion_client(notion_token)
+
+                    # Get or create exercise progress database
+                    exercise_db_id = get_or_create_exercise_db(client, database_id)
+
+                    # Look up existing pages once instead of querying per workout/exercise
+                    existing_workouts = load_existing_workouts(client, database_id, since)
+                    if exercise_db_id:
+                        exercise_entries = load_exercise_entries(client, exercise_db_id, since)
+
+                future = executor.submit(
+                    sync_workout,
+                    client,
+                    database_id,
+                    exercise_db_id,
+                    workout,
+                    existing_workouts.get(date),
+                    exercise_entries,
+                    args.rebuild,
+                )
+                futures[future] = workout
+
+                # Drain finished workouts before reading more so memory stays bounded
+                if len(futures) >= MAX_PENDING_WORKOUTS:
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        record_result(state, counts, future, futures.pop(future))
+
+            print(f"Found {total} workouts in CSV")
+            if cutoff:
+                print(f"Processing {processed} workouts from the last {args.days} days")
+
+            for future in as_completed(list(futures)):
+                record_result(state, counts, future, futures.pop(future))
+    finally:
+        state.close()
+
+    print(
+        f"\nDone: {counts['created']} created, {counts['rebuilt']} rebuilt, "
+        f"{counts['skipped']} skipped, {counts['unchanged']} unchanged, "
+        f"{counts['failed']} failed"
+    )
 
 if __name__ == "__main__":
     main()